@@ -1,3 +1,5 @@
+import functools
+import importlib
 import logging
 import re
 import time
@@ -8,6 +10,11 @@ import traceback
 import eva.exceptions
 
 
+# Don't emit log records from the EVA library unless the application has
+# configured logging.
+logging.getLogger('eva').addHandler(logging.NullHandler())
+
+
 def retry_n(func, args=(), kwargs={}, interval=5, exceptions=(Exception,), warning=1, error=3, give_up=5, logger=logging):
     """
     Call `func(*args, **kwargs)` and, if it throws anything listed in
@@ -34,7 +41,7 @@ def retry_n(func, args=(), kwargs={}, interval=5, exceptions=(Exception,), warni
         except exceptions as e:
             tries += 1
             if give_up > 0 and tries >= give_up:
-                logger.error('Action failed %d times, giving up: %s' % (give_up, e))
+                logger.error('Action failed %d times, giving up: %s', give_up, e)
                 return False
             if tries >= error:
                 logfunc = logger.error
@@ -42,24 +49,23 @@ def retry_n(func, args=(), kwargs={}, interval=5, exceptions=(Exception,), warni
                 logfunc = logger.warning
             else:
                 logfunc = logger.info
-            logfunc('Action failed, retrying in %d seconds: %s' % (interval, e))
+            logfunc('Action failed, retrying in %d seconds: %s', interval, e)
             time.sleep(interval)
 
 
+@functools.lru_cache(maxsize=None)
 def import_module_class(name):
     """
     Import a Python module and return it to the caller.
 
+    Results are cached, so subsequent lookups of the same name are cheap.
+
     :param str name: full dotted name to a Python module.
     :rtype: module
     :returns: the imported module.
     """
-    components = name.split('.')
-    modname = ('.').join(components[0:-1])
-    mod = __import__(modname)
-    for c in components[1:-1]:
-        mod = getattr(mod, c)
-    return getattr(mod, components[-1])
+    modname, _, classname = name.rpartition('.')
+    return getattr(importlib.import_module(modname), classname)
 
 
 def format_exception_as_bug(exception):
@@ -107,10 +113,10 @@ def in_array_or_empty(id, array):
     Check if `id` is found in `array`, or `array` is empty.
 
     :param id: the member to check.
-    :param list array: the list to check.
+    :param list|frozenset array: the container to check; use a set for constant time lookups.
     :rtype: bool
     """
-    return (array is None) or (len(array) == 0) or (id in array)
+    return not array or id in array
 
 
 def split_comma_separated(string):
@@ -246,13 +252,16 @@ def log_productstatus_resource_info(resource, logger, loglevel=logging.DEBUG):
     logger.log(loglevel, 'Resource: %s', resource)
     if not resource._collection._resource_name == 'datainstance':
         return
+    data = resource.data
+    productinstance = data.productinstance
+    product = productinstance.product
     logger.log(loglevel,
                'Product: %s [%s]',
-               resource.data.productinstance.product.name,
-               resource.data.productinstance.product.slug)
-    logger.log(loglevel, 'Data: %s', resource.data.id)
-    logger.log(loglevel, 'ProductInstance: %s', resource.data.productinstance.id)
+               product.name,
+               product.slug)
+    logger.log(loglevel, 'Data: %s', data.id)
+    logger.log(loglevel, 'ProductInstance: %s', productinstance.id)
     logger.log(loglevel, 'Data format: %s', resource.format.slug)
     logger.log(loglevel, 'Service backend: %s', resource.servicebackend.slug)
-    logger.log(loglevel, 'Reference time: %s', strftime_iso8601(resource.data.productinstance.reference_time, null_string=True))
-    logger.log(loglevel, 'Time step: from %s to %s', eva.strftime_iso8601(resource.data.time_period_begin, null_string=True), strftime_iso8601(resource.data.time_period_end, null_string=True))
+    logger.log(loglevel, 'Reference time: %s', strftime_iso8601(productinstance.reference_time, null_string=True))
+    logger.log(loglevel, 'Time step: from %s to %s', strftime_iso8601(data.time_period_begin, null_string=True), strftime_iso8601(data.time_period_end, null_string=True))
@@ -1,4 +1,5 @@
 import argparse
+import concurrent.futures
 import configparser
 import kazoo.client
 import kazoo.exceptions
@@ -8,14 +9,16 @@ import os
 import signal
 import sys
 import time
+import types
 import uuid
 
 import productstatus.exceptions
 
-import eva.adapter
+import eva.base.adapter
+import eva.base.executor
+import eva.base.listener
 import eva.config
 import eva.eventloop
-import eva.executor
 import eva.globe
 import eva.logger
 import eva.mail
@@ -37,15 +40,110 @@ NOISY_LOGGERS = [
     'paramiko',
 ]
 
+# Logger objects are singletons, look them up only once. Setting the level on
+# the top-level logger of each noisy family also covers any descendant loggers
+# that are created later, since they inherit their effective level.
+_ROOT_LOGGER = logging.getLogger('root')
+_NOISY_LOGGER_FAMILIES = frozenset(name.partition('.')[0] for name in NOISY_LOGGERS)
+_NOISY_LOGGER_OBJECTS = [logging.getLogger(name) for name in sorted(_NOISY_LOGGER_FAMILIES)]
+
 EXIT_SUCCESS = 0
 EXIT_INVALID_CONFIG = 1
 EXIT_ALREADY_RUNNING = 2
 EXIT_BUG = 255
 
+#: Shutdown messages for the signals handled by _shutdown_signal().
+_SIGNAL_MESSAGES = {
+    signal.SIGINT: 'Caught signal SIGINT, exiting.',
+    signal.SIGTERM: 'Caught signal SIGTERM, exiting.',
+}
+
+
+def _build_parser():
+    """!
+    @brief Build the command line argument parser.
+    """
+    parser = argparse.ArgumentParser()  # FIXME: epilog
+    parser_rpc_group = parser.add_mutually_exclusive_group()
+    parser_rpc_group.add_argument(
+        '--process_all_in_product_instance',
+        action='store',
+        type=str,
+        required=False,
+        metavar='UUID',
+        help='Process all DataInstance resources belonging to a specific ProductInstance',
+    )
+    parser_rpc_group.add_argument(
+        '--process_data_instance',
+        action='store',
+        type=str,
+        required=False,
+        metavar='UUID',
+        help='Process a single DataInstance resource',
+    )
+    parser.add_argument(
+        '--debug',
+        action='store_true',
+        default=False,
+        help='Print DEBUG log statements by default',
+    )
+    parser.add_argument(
+        '--group-id',
+        action='store',
+        help='Manually set the EVA group id (DANGEROUS!)',
+    )
+    parser.add_argument(
+        '--rest-server-port',
+        action='store',
+        type=int,
+        help='Run a HTTP REST server offering remote control of EVA, on all interfaces at the specified port',
+    )
+    parser.add_argument(
+        '--config',
+        action='append',
+        required=True,
+        type=str,
+        help='Load the specified configuration file, or an entire directory structure of configuration files. Can be specified multiple times.',
+    )
+    parser.add_argument(
+        '--log-config',
+        action='store',
+        type=str,
+        help='Use the specified configuration file for logging configuration.',
+    )
+    parser.add_argument(
+        '--config-test',
+        action='store_true',
+        help='Test the configuration consistency and exit.',
+    )
+    parser.add_argument(
+        '--zookeeper-backoff',
+        type=int,
+        default=60,
+        help='How many seconds to wait between each attempt to acquire the ZooKeeper single instance lock.',
+    )
+    return parser
+
+
+#: Command line argument parser, shared by all Main instances.
+_PARSER = _build_parser()
+
+
+def _shutdown_signal(sig, frame):
+    """!
+    @brief Signal handler that interrupts the main loop with a shutdown request.
+    """
+    # Don't keep the interrupted stack frame alive through the exception.
+    del frame
+    message = _SIGNAL_MESSAGES.get(sig)
+    if message is None:
+        message = 'Caught signal %d, exiting.' % sig
+    raise eva.exceptions.ShutdownException(message)
+
 
 class Main(eva.config.ConfigurableObject):
 
-    CONFIG = {
+    CONFIG = types.MappingProxyType({
         'listeners': {
             'type': 'list_string',
             'help': 'Comma separated Python class names of listeners that should be run',
@@ -75,25 +173,30 @@ class Main(eva.config.ConfigurableObject):
             'help': 'ZooKeeper endpoints in the form <host>:<port>[,<host>:<port>,[...]]/<path>',
             'default': '',
         },
-    }
+    })
 
-    OPTIONAL_CONFIG = [
+    OPTIONAL_CONFIG = frozenset([
         'listeners',
         'statsd',
-    ]
+    ])
 
-    REQUIRED_CONFIG = [
+    REQUIRED_CONFIG = frozenset([
         'mailer',
         'productstatus',
         'rest_server',
         'zookeeper',
-    ]
+    ])
 
     def __init__(self):
         self.args = None
         self.config_class = {}
         self.incubator_class = {}
-        self.logger = logging.getLogger('root')
+        self._sorted_sections = []
+        self._configurable_classes = {}
+        self.client_id = None
+        self.group_id = None
+        self.logger = _ROOT_LOGGER
+        self.statsd = None
         self.zookeeper = None
         self.globe = eva.globe.Global(group_id=None,
                                       logger=self.logger,
@@ -147,95 +250,43 @@ class Main(eva.config.ConfigurableObject):
         return self.env['rest_server']
 
     def parse_args(self):
-        parser = argparse.ArgumentParser()  # FIXME: epilog
-        parser_rpc_group = parser.add_mutually_exclusive_group()
-        parser_rpc_group.add_argument(
-            '--process_all_in_product_instance',
-            action='store',
-            type=str,
-            required=False,
-            metavar='UUID',
-            help='Process all DataInstance resources belonging to a specific ProductInstance',
-        )
-        parser_rpc_group.add_argument(
-            '--process_data_instance',
-            action='store',
-            type=str,
-            required=False,
-            metavar='UUID',
-            help='Process a single DataInstance resource',
-        )
-        parser.add_argument(
-            '--debug',
-            action='store_true',
-            default=False,
-            help='Print DEBUG log statements by default',
-        )
-        parser.add_argument(
-            '--group-id',
-            action='store',
-            help='Manually set the EVA group id (DANGEROUS!)',
-        )
-        parser.add_argument(
-            '--rest-server-port',
-            action='store',
-            type=int,
-            help='Run a HTTP REST server offering remote control of EVA, on all interfaces at the specified port',
-        )
-        parser.add_argument(
-            '--config',
-            action='append',
-            required=True,
-            type=str,
-            help='Load the specified configuration file, or an entire directory structure of configuration files. Can be specified multiple times.',
-        )
-        parser.add_argument(
-            '--log-config',
-            action='store',
-            type=str,
-            help='Use the specified configuration file for logging configuration.',
-        )
-        parser.add_argument(
-            '--config-test',
-            action='store_true',
-            help='Test the configuration consistency and exit.',
-        )
-        parser.add_argument(
-            '--zookeeper-backoff',
-            type=int,
-            default=60,
-            help='How many seconds to wait between each attempt to acquire the ZooKeeper single instance lock.',
-        )
-        self.args = parser.parse_args()
-
-    @staticmethod
-    def signal_handler(sig, frame):
-        raise eva.exceptions.ShutdownException('Caught signal %d, exiting.' % sig)
+        self.args = _PARSER.parse_args()
 
     def setup_signals(self):
         """!
         @brief Set up signals to catch interrupts and exit cleanly.
         """
-        signal.signal(signal.SIGINT, self.signal_handler)
-        signal.signal(signal.SIGTERM, self.signal_handler)
+        signal.signal(signal.SIGINT, _shutdown_signal)
+        signal.signal(signal.SIGTERM, _shutdown_signal)
 
     def setup_basic_logging(self):
         """!
         @brief Set up a minimal logging configuration.
+
+        Any handlers already attached to the root logger are replaced, so that
+        calling this function more than once does not duplicate log output.
         """
-        logging.basicConfig(format='%(asctime)s: (%(levelname)s) %(message)s',
-                            datefmt='%Y-%m-%dT%H:%M:%S%Z',
-                            level=logging.INFO)
-        self.logger = logging.getLogger('root')
+        formatter = eva.logger.CachingFormatter(fmt='%(asctime)s: (%(levelname)s) %(message)s',
+                                                datefmt='%Y-%m-%dT%H:%M:%S%Z')
+        handler = logging.StreamHandler()
+        handler.setFormatter(formatter)
+        for existing_handler in logging.root.handlers[:]:
+            logging.root.removeHandler(existing_handler)
+        logging.root.addHandler(handler)
+        logging.root.setLevel(logging.INFO)
+        self.logger = _ROOT_LOGGER
 
     def setup_logging(self):
         """!
         @brief Override default logging configuration.
         """
-        # Read configuration from parsed configuration
+        # Read configuration from parsed configuration, falling back to a
+        # minimal configuration if no logging configuration file is given
         if self.args.log_config:
             logging.config.fileConfig(self.args.log_config, disable_existing_loggers=False)
-            self.logger = logging.getLogger('root')
+            self.logger = _ROOT_LOGGER
+        else:
+            self.setup_basic_logging()
 
         # Inject certain variables into all log records
         log_filter = eva.logger.WildcardLogFilter(
@@ -248,11 +299,12 @@ class Main(eva.config.ConfigurableObject):
         # Add logging filter into any existing loggers so that all output will
         # be correctly filtered.
         self.logger.addFilter(log_filter)
-        for key in sorted(logging.Logger.manager.loggerDict.keys()):
-            logger = logging.Logger.manager.loggerDict[key]
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        for key, logger in sorted(logging.Logger.manager.loggerDict.items()):
             if not isinstance(logger, logging.Logger):
                 continue
-            self.logger.debug('Adding logging filter to logger: %s', key)
+            if debug:
+                self.logger.debug('Adding logging filter to logger: %s', key)
             logger.addFilter(log_filter)
 
         # Set DEBUG loglevel if --debug passed
@@ -260,8 +312,8 @@ class Main(eva.config.ConfigurableObject):
             self.logger.setLevel(logging.DEBUG)
 
         # Disable DEBUG logging on some noisy loggers
-        for noisy_logger in NOISY_LOGGERS:
-            logging.getLogger(noisy_logger).setLevel(logging.INFO)
+        for noisy_logger in _NOISY_LOGGER_OBJECTS:
+            noisy_logger.setLevel(logging.INFO)
 
     def get_config_filenames(self, filenames):
         """!
@@ -272,29 +324,52 @@ class Main(eva.config.ConfigurableObject):
         expanded_filenames = []
         for filename in filenames:
             if os.path.isdir(filename):
-                for (path, dirs, files) in os.walk(filename):
-                    for filename in files:
-                        if filename[-4:] != '.ini':
-                            continue
-                        expanded_filenames += [os.path.realpath(os.path.join(path, filename))]
+                expanded_filenames += sorted(self.scan_config_directory(filename))
             elif os.path.isfile(filename) or os.path.islink(filename):
                 expanded_filenames += [os.path.realpath(filename)]
         return expanded_filenames
 
+    @staticmethod
+    def scan_config_directory(path):
+        """!
+        @brief Recursively scan a directory for files ending with ".ini", and
+        return their real paths. Symbolic links to directories are not
+        followed, and unreadable directories are skipped.
+        """
+        found = []
+        stack = [path]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            stack.append(entry.path)
+                    elif entry.name.endswith('.ini'):
+                        found.append(os.path.realpath(entry.path))
+        return found
+
     def setup_configuration(self):
         """!
         @brief Scan for and read all configuration files into the `self.config` object.
         """
         self.logger.info('Scanning for configuration files...')
         filenames = self.get_config_filenames(self.args.config)
-        for filename in filenames:
-            self.logger.info('Found configuration file: %s', filename)
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            for filename in filenames:
+                self.logger.debug('Found configuration file: %s', filename)
         self.config = configparser.ConfigParser()
-        self.logger.info('Reading all configuration files...')
+        self.logger.info('Reading %d configuration files...', len(filenames))
         self.config.read(filenames, encoding='utf-8')
         self.logger.info('Successfully read and parsed all configuration files.')
-        for section in sorted(self.config.sections()):
-            self.logger.debug('Found configuration section: %s', section)
+        self._sorted_sections = [sys.intern(section) for section in sorted(self.config.sections())]
+        if debug:
+            for section in self._sorted_sections:
+                self.logger.debug('Found configuration section: %s', section)
 
     def setup_eva_configuration(self):
         """!
@@ -315,19 +390,29 @@ class Main(eva.config.ConfigurableObject):
         """!
         @brief Set up a the HTTP REST API server.
         """
-        if self.args.rest_server_port:
+        if self.oneshot():
+            self.logger.info('Not starting HTTP REST API server when processing a single resource set.')
+        elif self.args.rest_server_port:
             self.rest_server.start('0.0.0.0', self.args.rest_server_port)
             self.logger.info('Started HTTP REST API server on 0.0.0.0:%d', self.args.rest_server_port)
         else:
             self.logger.warning('Not running HTTP REST API server!')
 
+    def oneshot(self):
+        """!
+        @brief Return True if EVA has been asked to process a specific set of
+        resources and then exit, instead of running as a daemon.
+        """
+        return bool(self.args.process_all_in_product_instance or self.args.process_data_instance)
+
     def setup_statsd_client(self):
         """!
         @brief Set up a StatsD client that will send data to multiple servers simultaneously.
         """
-        self.statsd = eva.statsd.StatsDClient({'application': self.group_id}, self.env['statsd'])
-        if len(self.env['statsd']) > 0:
-            self.logger.info('StatsD client set up with application tag "%s", sending data to: %s', self.group_id, ', '.join(self.env['statsd']))
+        endpoints = self.env['statsd']
+        self.statsd = eva.statsd.StatsDClient({'application': self.group_id}, endpoints)
+        if endpoints:
+            self.logger.info('StatsD client set up with application tag "%s", sending data to: %s', self.group_id, ', '.join(endpoints))
         else:
             self.logger.warning('StatsD not configured, will not send metrics.')
 
@@ -335,14 +420,14 @@ class Main(eva.config.ConfigurableObject):
         """!
         @brief Instantiate the Zookeeper client, if enabled.
         """
-        if not self.env['zookeeper']:
+        zookeeper = self.env['zookeeper']
+        if not zookeeper:
             self.logger.warning('ZooKeeper not configured.')
             return
 
-        self.logger.info('Setting up Zookeeper connection to %s', self.env['zookeeper'])
-        tokens = self.env['zookeeper'].strip().split(u'/')
-        server_string = tokens[0]
-        base_path = os.path.join('/', os.path.join(*tokens[1:]))
+        self.logger.info('Setting up Zookeeper connection to %s', zookeeper)
+        server_string, _, path = zookeeper.strip().partition('/')
+        base_path = '/' + path.strip('/')
         self.zookeeper = kazoo.client.KazooClient(
             hosts=server_string,
             randomize_hosts=True,
@@ -394,25 +479,23 @@ class Main(eva.config.ConfigurableObject):
         """
         self.logger.info('Instantiating classes from configuration file...')
 
-        sections = self.config.sections()
-        for section in sections:
+        for section in self._sorted_sections:
             if section == 'eva':
                 # FIXME
                 continue
             config = eva.config.resolved_config_section(self.config, section)
+            class_name = config.pop('class', None)
             abstract = ('abstract' in config and eva.config.ConfigurableObject.normalize_config_bool(config['abstract']))
-            if 'class' not in config and not abstract:
-                raise eva.exceptions.InvalidConfigurationException(
-                    "Invalid configuration section '%s': not a class instance, and not defined as abstract" % section
-                )
-            if 'class' not in config:
+            if class_name is None:
+                if not abstract:
+                    raise eva.exceptions.InvalidConfigurationException(
+                        "Invalid configuration section '%s': not a class instance, and not defined as abstract" % section
+                    )
                 self.logger.info("Ignoring non-class configuration section '%s'.", section)
                 continue
             elif abstract:
                 self.logger.info("Ignoring abstract configuration section '%s'.", section)
                 continue
-            class_name = config['class']
-            del config['class']
             self.logger.info("Instantiating '%s' from configuration section '%s'.", class_name, section)
             class_type = eva.import_module_class(class_name)
             if not issubclass(class_type, eva.config.ConfigurableObject):
@@ -429,6 +512,14 @@ class Main(eva.config.ConfigurableObject):
         self.config_class['eva'] = self
         self.incubator_class['eva'] = self
 
+        # Some classes return foreign objects from _factory(), e.g. the
+        # Productstatus API. Those take no part in dependency resolution and
+        # initialization, so filter them out once.
+        self._configurable_classes = {
+            key: instance for key, instance in self.config_class.items()
+            if isinstance(instance, eva.config.ConfigurableObject)
+        }
+
         self.logger.info('Finished instantiating classes from configuration file.')
 
     def resolve_config_class_dependencies(self):
@@ -438,9 +529,7 @@ class Main(eva.config.ConfigurableObject):
         """
         self.logger.info('Resolving class dependencies...')
 
-        for key, instance in self.config_class.items():
-            if not isinstance(instance, eva.config.ConfigurableObject):
-                continue
+        for key, instance in self._configurable_classes.items():
             self.logger.info("Resolving dependencies for '%s'...", key)
             instance.resolve_dependencies(self.config_class)
 
@@ -453,9 +542,7 @@ class Main(eva.config.ConfigurableObject):
         """
         self.logger.info('Initializing classes...')
 
-        for instance in self.config_classes:
-            if not isinstance(instance, eva.config.ConfigurableObject):
-                continue
+        for instance in self._configurable_classes.values():
             self.logger.info("Initializing '%s'...", instance)
             if isinstance(instance, eva.globe.GlobalMixin):
                 instance.set_globe(self.globe)
@@ -521,9 +608,8 @@ class Main(eva.config.ConfigurableObject):
     def setup(self):
         try:
             # Basic pre-flight setup: argument parsing, signals, logging setup
-            self.setup_basic_logging()
-            self.setup_signals()
             self.parse_args()
+            self.setup_signals()
             self.setup_client_group_id()
             self.setup_logging()
 
@@ -535,14 +621,25 @@ class Main(eva.config.ConfigurableObject):
             self.setup_configuration()
             self.setup_eva_configuration()
 
-            # Set up objects required for the Global class
-            self.setup_statsd_client()
-            self.setup_zookeeper()
-
-            # Instantiate, link and initialize everything
-            self.instantiate_config_classes()
-            self.print_configuration()
-            self.resolve_config_class_dependencies()
+            # Connect to ZooKeeper in the background, while setting up the
+            # rest of the objects required for the Global class. The
+            # connection is only needed once the Global class is created.
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+            zookeeper_future = executor.submit(self.setup_zookeeper)
+            try:
+                self.setup_statsd_client()
+
+                # Instantiate and link everything
+                self.instantiate_config_classes()
+                self.print_configuration()
+                self.resolve_config_class_dependencies()
+            finally:
+                # Don't hold back setup errors until the connection attempt
+                # has finished; the result is only needed on success.
+                executor.shutdown(wait=False)
+            zookeeper_future.result()
+
+            # Initialize everything
             self.setup_globe()
             self.init_config_classes()
             self.print_adapters()
@@ -588,7 +685,7 @@ class Main(eva.config.ConfigurableObject):
             evaloop.init()
             evaloop.restore_queue()
 
-            if self.args.process_all_in_product_instance or self.args.process_data_instance:
+            if self.oneshot():
                 evaloop.listeners = []
                 if self.args.process_all_in_product_instance:
                     evaloop.process_all_in_product_instance(self.args.process_all_in_product_instance)
@@ -615,7 +712,7 @@ class Main(eva.config.ConfigurableObject):
         self.exit(EXIT_SUCCESS)
 
     def exit(self, exit_code):
-        if hasattr(self, 'statsd'):
+        if self.statsd is not None:
             self.statsd.incr('eva_shutdown', tags={'exit_code': exit_code})
         sys.exit(exit_code)
 
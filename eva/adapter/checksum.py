@@ -1,21 +1,38 @@
+import re
+import shlex
+
 import eva
 import eva.base.adapter
 import eva.job
 import eva.exceptions
 
 
+# The hash file is read once with a shell builtin, and the hash is printed for
+# detection in finish_job(). File names must be shell quoted.
+CHECKSUM_COMMAND = (
+    'set -e',
+    'read -r md5 _ < %(md5_filename)s || test -n "$md5"',
+    'echo "eva.adapter.checksum.md5 $md5"',
+    'printf "%%s  %%s\\n" "$md5" %(dataset_filename)s | md5sum --check --status --strict -',
+)
+
+MD5SUM_PREFIX = 'eva.adapter.checksum.md5 '
+MD5SUM_REGEX = re.compile(r'^eva\.adapter\.checksum\.md5 ([0-9a-fA-F]{32})\s*$')
+
+
 def job_output_md5sum(stdout):
     """
-    Find the MD5 sum from the job output.
+    Find the MD5 sum from the job output. Only the first line starting with
+    the checksum marker is considered, and it must contain a valid MD5 hex
+    digest.
     """
     for line in stdout:
-        if not line.startswith('eva.adapter.checksum.md5 '):
+        if not line.startswith(MD5SUM_PREFIX):
             continue
-        tokens = line.strip().split()
-        md5 = tokens[1]
-        if len(md5) != 32:
+        matches = MD5SUM_REGEX.match(line)
+        if not matches:
             break
-        return md5
+        return matches.group(1)
     return None
 
 
@@ -62,16 +79,11 @@ class ChecksumVerificationAdapter(eva.base.adapter.BaseAdapter):
         job.logger.info("Starting verification of file '%s' against md5sum file '%s'.", job.dataset_filename, job.md5_filename)
 
         values = {
-            'dataset_filename': job.dataset_filename,
-            'md5_filename': job.md5_filename,
+            'dataset_filename': shlex.quote(job.dataset_filename),
+            'md5_filename': shlex.quote(job.md5_filename),
         }
 
-        job.command = [
-            'set -e',
-            'echo -n "eva.adapter.checksum.md5 "',
-            'cat %(md5_filename)s' % values,  # for hash detection in generate_resources()
-            'printf "%%s  %(dataset_filename)s\\n" $(cat %(md5_filename)s) | md5sum --check --status --strict -' % values,
-        ]
+        job.command = [line % values for line in CHECKSUM_COMMAND]
 
     def finish_job(self, job):
         if not job.complete():
@@ -101,7 +101,12 @@ class CWFAdapter(eva.base.adapter.BaseAdapter):
             raise eva.exceptions.InvalidConfigurationException(
                 'Number of instances in cwf_parallel must be equal to or higher than 1.'
             )
+        if not self.env['cwf_lifetime']:
+            raise eva.exceptions.InvalidConfigurationException(
+                'At least one DataInstance lifetime must be specified in cwf_lifetime.'
+            )
         self.nml_data_format = self.api.dataformat[self.env['cwf_nml_data_format']]
+        self.output_directory_template = self.template.from_string(self.env['cwf_output_directory_pattern'])
 
     def is_netcdf_data_output(self, data):
         """
@@ -129,46 +134,40 @@ class CWFAdapter(eva.base.adapter.BaseAdapter):
             qs = self.api.datainstance.objects.filter(data__productinstance__product=self.output_product,
                                                       data__productinstance__reference_time=reference_time,
                                                       servicebackend=self.output_service_backend,
-                                                      deleted=False)
+                                                      deleted=False).limit(1)
             if qs.count() != 0:
                 raise eva.exceptions.JobNotGenerated("Destination data set already exists in Productstatus, skipping processing.")
 
-        job.output_directory_template = self.template.from_string(
-            self.env['cwf_output_directory_pattern']
-        )
-        job.output_directory = job.output_directory_template.render(
+        job.output_directory = self.output_directory_template.render(
             reference_time=reference_time,
             domain=self.env['cwf_domain'],
         )
 
-        job.command = []
-        if self.env['cwf_parallel'] > 1:
-            job.command += ['#$ -pe mpi-fn %d' % self.env['cwf_parallel']]
-        if self.env['cwf_parallel'] > 1:
-            job.command += ['export ECDIS_PARALLEL=1']
-        else:
-            job.command += ['export ECDIS_PARALLEL=0']
-        job.command += ['export DATE=%s' % reference_time.strftime('%Y%m%d')]
-        job.command += ['export DOMAIN=%s' % self.env['cwf_domain']]
-        job.command += ['export ECDIS=%s' % eva.url_to_filename(job.resource.url)]
-        job.command += ['export ECDIS_TMPDIR=%s' % os.path.join(job.output_directory, 'work')]
-        job.command += ['export NDAYS_MAX=%d' % self.env['cwf_output_days']]
-        job.command += ['export NREC_DAY_MIN=%d' % self.env['cwf_input_min_days']]
-        job.command += ['export OUTDIR=%s' % job.output_directory]
-        job.command += ['export UTC=%s' % reference_time.strftime('%H')]
-        job.command += ['%s >&2' % self.env['cwf_script_path']]
-
-        # Run output recognition
+        parallel = self.env['cwf_parallel']
         datestamp_glob = reference_time.strftime('*%Y%m%d_*.*')
-        job.command += ['echo "===eva.adapter.cwf==="']
-        job.command += ['for file in %s; do' % os.path.join(job.output_directory, datestamp_glob)]
-        job.command += ['    if [[ $file =~ \.nc$ ]]; then']
-        job.command += ['        echo -n "$file "']
-        job.command += ["        ncdump -l 1000 -t -v time $file | grep -E '^ ?time\s*='"]
-        job.command += ['    elif [[ $file =~ \.nml$ ]]; then']
-        job.command += ['        echo "$file"']
-        job.command += ['    fi']
-        job.command += ['done']
+
+        job.command = (['#$ -pe mpi-fn %d' % parallel] if parallel > 1 else []) + [
+            'export ECDIS_PARALLEL=%d' % (1 if parallel > 1 else 0),
+            'export DATE=%s' % reference_time.strftime('%Y%m%d'),
+            'export DOMAIN=%s' % self.env['cwf_domain'],
+            'export ECDIS=%s' % eva.url_to_filename(job.resource.url),
+            'export ECDIS_TMPDIR=%s' % os.path.join(job.output_directory, 'work'),
+            'export NDAYS_MAX=%d' % self.env['cwf_output_days'],
+            'export NREC_DAY_MIN=%d' % self.env['cwf_input_min_days'],
+            'export OUTDIR=%s' % job.output_directory,
+            'export UTC=%s' % reference_time.strftime('%H'),
+            '%s >&2' % self.env['cwf_script_path'],
+            # Run output recognition
+            'echo "===eva.adapter.cwf==="',
+            'for file in %s; do' % os.path.join(job.output_directory, datestamp_glob),
+            r'    if [[ $file =~ \.nc$ ]]; then',
+            '        echo -n "$file "',
+            r"        ncdump -l 1000 -t -v time $file | grep -E '^ ?time\s*='",
+            r'    elif [[ $file =~ \.nml$ ]]; then',
+            '        echo "$file"',
+            '    fi',
+            'done',
+        ]
 
     def finish_job(self, job):
         if not job.complete():
@@ -200,11 +199,17 @@ class CWFAdapter(eva.base.adapter.BaseAdapter):
                 if line == '===eva.adapter.cwf===':
                     threshold = True
                 continue
-            data = {}
             tokens = line.split()
-            data['path'] = tokens[0]
-            data['extension'] = os.path.splitext(data['path'])[1]
-            if self.is_netcdf_data_output(data):
+            path = tokens[0]
+            # The job script only prints NetCDF and NML files
+            if path.endswith('.nc'):
+                extension = '.nc'
+            elif path.endswith('.nml'):
+                extension = '.nml'
+            else:
+                extension = os.path.splitext(path)[1]
+            data = {'path': path, 'extension': extension}
+            if extension == '.nc':
                 time_str = ' '.join(tokens[3:-1])
                 times = sorted([eva.netcdf_time_to_timestamp(x.strip(' "')) for x in time_str.split(',')])
                 data['time_steps'] = times
@@ -228,22 +233,32 @@ class CWFAdapter(eva.base.adapter.BaseAdapter):
         )
         resources['productinstance'] = [product_instance]
 
+        # Expiry times only depend on the position of the file in the output set
+        netcdf_expiries = [self.expiry_from_hours(hours) for hours in self.env['cwf_lifetime']]
+        last_netcdf_expiry_index = len(netcdf_expiries) - 1
+        # let the NML file live as long as the shortest lived file in the output dataset
+        nml_expiry = self.expiry_from_hours(min(self.env['cwf_lifetime']))
         lifetime_index = 0
 
-        for output_file in job.output_files:
-            parameters = {
-                'productinstance': product_instance,
-            }
+        # Files covering the same time period share a single Data resource
+        data_by_time_period = {}
 
+        for output_file in job.output_files:
             if self.is_netcdf_data_output(output_file):
-                parameters['time_period_begin'] = output_file['time_steps'][0]
-                parameters['time_period_end'] = output_file['time_steps'][-1]
+                time_period = (output_file['time_steps'][0], output_file['time_steps'][-1])
             else:
-                parameters['time_period_begin'] = None
-                parameters['time_period_end'] = None
+                time_period = (None, None)
 
-            data = productstatus.api.EvaluatedResource(self.api.data.find_or_create_ephemeral, parameters)
-            resources['data'] += [data]
+            data = data_by_time_period.get(time_period)
+            if data is None:
+                parameters = {
+                    'productinstance': product_instance,
+                    'time_period_begin': time_period[0],
+                    'time_period_end': time_period[1],
+                }
+                data = productstatus.api.EvaluatedResource(self.api.data.find_or_create_ephemeral, parameters)
+                data_by_time_period[time_period] = data
+                resources['data'] += [data]
 
             data_instance = self.api.datainstance.create()
             data_instance.data = data
@@ -252,16 +267,12 @@ class CWFAdapter(eva.base.adapter.BaseAdapter):
 
             if self.is_netcdf_data_output(output_file):
                 data_instance.format = self.output_data_format
-                if lifetime_index < len(self.env['cwf_lifetime']):
-                    data_instance.expires = self.expiry_from_hours(self.env['cwf_lifetime'][lifetime_index])
-                else:
-                    data_instance.expires = self.expiry_from_hours(self.env['cwf_lifetime'][-1])
+                data_instance.expires = netcdf_expiries[min(lifetime_index, last_netcdf_expiry_index)]
                 lifetime_index += 1
             elif self.is_nml_data_output(output_file):
                 data_instance.format = self.nml_data_format
-                # let the NML file live as long as the shortest lived file in the output dataset
-                data_instance.expires = self.expiry_from_hours(min(self.env['cwf_lifetime']))
+                data_instance.expires = nml_expiry
             else:
-                raise RuntimeError('Unsupported data format in job output: %s' % data['extension'])
+                raise RuntimeError('Unsupported data format in job output: %s' % output_file['extension'])
 
             resources['datainstance'] += [data_instance]
@@ -6,6 +6,14 @@ import eva.job
 import eva.exceptions
 
 
+#: Job command templates for each of the supported distribution methods.
+DISTRIBUTION_COMMANDS = {
+    'bbcp': "bbcp -v %(params)s %(source)s %(hostspec)s%(destination)s",
+    'cp': "cp --verbose %(params)s %(source)s %(destination)s",
+    'scp': "scp %(params)s %(source)s %(hostspec)s%(destination)s",
+}
+
+
 class DistributionAdapter(eva.base.adapter.BaseAdapter):
     """
     The ``DistributionAdapter`` copies files to other locations.
@@ -68,39 +76,30 @@ class DistributionAdapter(eva.base.adapter.BaseAdapter):
         """
         if self.env['output_service_backend'] in self.env['input_service_backend']:
             raise eva.exceptions.InvalidConfigurationException('output_service_backend cannot be present in the list of input_service_backend, as that will result in an endless loop.')
-        self.func = self.distribution_func(self.env['distribution_method'])
-        if self.func is None:
-            raise eva.exceptions.InvalidConfigurationException('distribution_method must be set to one of the supported methods "cp" or "bbcp".')
+        self.command_template = DISTRIBUTION_COMMANDS.get(self.env['distribution_method'])
+        if self.command_template is None:
+            raise eva.exceptions.InvalidConfigurationException('distribution_method must be set to one of the supported methods "cp", "scp" or "bbcp".')
         if len(self.env['distribution_destination']) > 0:
             self.env['distribution_destination'] += ':'
-
-    def distribution_func(self, method):
-        if method == 'cp':
-            return self.job_script_cp
-        elif method == 'scp':
-            return self.job_script_scp
-        elif method == 'bbcp':
-            return self.job_script_bbcp
-        else:
-            return None
+        self.output_url_prefix = os.path.join(self.env['output_base_url'], '')
 
     def create_job(self, job):
         """!
         @brief Create a Job object that will copy a file to another
         destination, and optionally post the result to Productstatus.
         """
-        job.base_filename = os.path.basename(job.resource.url)
+        job.base_filename = job.resource.url.rpartition('/')[2]
         job.input_file = eva.url_to_filename(job.resource.url)
-        job.output_url = os.path.join(self.env['output_base_url'], job.base_filename)
+        job.output_url = self.output_url_prefix + job.base_filename
         job.output_file = eva.url_to_filename(job.output_url)
 
         if self.post_to_productstatus():
-            job.service_backend = self.api.servicebackend[self.env['output_service_backend']]
+            job.service_backend = self.output_service_backend
             # check if the destination file already exists
             qs = self.api.datainstance.objects.filter(url=job.output_url,
                                                       servicebackend=job.service_backend,
                                                       data=job.resource.data,
-                                                      format=job.resource.format)
+                                                      format=job.resource.format).limit(1)
             if qs.count() != 0:
                 raise eva.exceptions.JobNotGenerated("Destination URL '%s' already exists in Productstatus; this file has already been distributed." % job.output_url)
 
@@ -110,22 +109,7 @@ class DistributionAdapter(eva.base.adapter.BaseAdapter):
             'hostspec': self.env['distribution_destination'],
             'params': self.env['distribution_parameters'],
         }
-        job.command = self.func(params)
-
-    def job_script_cp(self, params):
-        return [
-            "cp --verbose %(params)s %(source)s %(destination)s" % params,
-        ]
-
-    def job_script_bbcp(self, params):
-        return [
-            "bbcp -v %(params)s %(source)s %(hostspec)s%(destination)s" % params,
-        ]
-
-    def job_script_scp(self, params):
-        return [
-            "scp %(params)s %(source)s %(hostspec)s%(destination)s" % params,
-        ]
+        job.command = [self.command_template % params]
 
     def finish_job(self, job):
         if not job.complete():
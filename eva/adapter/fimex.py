@@ -68,6 +68,7 @@ class FimexAdapter(eva.base.adapter.BaseAdapter):
     def adapter_init(self):
         self.fimex_parameters = self.template.from_string(self.env['fimex_parameters'])
         self.output_filename = self.template.from_string(self.env['output_filename_pattern'])
+        self.output_url_prefix = os.path.join(self.env['output_base_url'], '')
 
     def create_job(self, job):
         """!
@@ -113,12 +114,13 @@ class FimexAdapter(eva.base.adapter.BaseAdapter):
         ProductInstance. Existing Data and DataInstance objects are re-used.
         """
         # Generate ProductInstance resource
+        input_productinstance = job.resource.data.productinstance
         parameters = {
             'product': self.output_product,
-            'reference_time': job.resource.data.productinstance.reference_time,
+            'reference_time': input_productinstance.reference_time,
         }
-        if self.output_product == job.resource.data.productinstance.product:
-            parameters['version'] = job.resource.data.productinstance.version
+        if self.output_product == input_productinstance.product:
+            parameters['version'] = input_productinstance.version
         product_instance = productstatus.api.EvaluatedResource(self.api.productinstance.find_or_create_ephemeral, parameters)
         resources['productinstance'] += [product_instance]
 
@@ -139,7 +141,7 @@ class FimexAdapter(eva.base.adapter.BaseAdapter):
                 'expires': self.expiry_from_lifetime(),
                 'format': self.output_data_format,
                 'servicebackend': self.output_service_backend,
-                'url': os.path.join(self.env['output_base_url'], os.path.basename(job.output_filename)),
+                'url': self.output_url_prefix + os.path.basename(job.output_filename),
             }
         )
         resources['datainstance'] = [datainstance]
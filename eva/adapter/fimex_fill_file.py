@@ -78,6 +78,7 @@ class FimexFillFileAdapter(eva.base.adapter.BaseAdapter):
         self.ncfill_path = self.env['fimex_fill_file_ncfill_path']
         self.template_directory = self.template.from_string(self.env['fimex_fill_file_template_directory'])
         self.output_filename = self.template.from_string(self.env['output_filename_pattern'])
+        self.output_url_prefix = os.path.join(self.env['output_base_url'], '')
 
     def create_job(self, job):
         job.input_filename = eva.url_to_filename(job.resource.url)
@@ -131,5 +132,5 @@ class FimexFillFileAdapter(eva.base.adapter.BaseAdapter):
         datainstance.expires = self.expiry_from_lifetime()
         datainstance.format = self.output_data_format
         datainstance.servicebackend = self.output_service_backend
-        datainstance.url = os.path.join(self.env['output_base_url'], os.path.basename(job.output_filename))
+        datainstance.url = self.output_url_prefix + os.path.basename(job.output_filename)
         resources['datainstance'] += [datainstance]
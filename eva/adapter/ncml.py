@@ -104,8 +104,9 @@ class NcMLAggregationAdapter(eva.base.adapter.BaseAdapter):
         a new job that creates an NcML file listing all the DataInstance
         resources.
         """
+        productinstance = job.resource.data.productinstance
         qs = self.api.datainstance.objects.filter(
-            data__productinstance=job.resource.data.productinstance,
+            data__productinstance=productinstance,
             format=job.resource.format,
             servicebackend=job.resource.servicebackend,
         )
@@ -120,7 +121,7 @@ class NcMLAggregationAdapter(eva.base.adapter.BaseAdapter):
         job.template_variables = {
             'datainstance': job.resource,
             'input_filename': os.path.basename(eva.url_to_filename(job.resource.url)),
-            'reference_time': job.resource.data.productinstance.reference_time,
+            'reference_time': productinstance.reference_time,
         }
         try:
             job.output_filename = self.output_filename.render(**job.template_variables)
@@ -130,8 +131,8 @@ class NcMLAggregationAdapter(eva.base.adapter.BaseAdapter):
         # Generate XML
         urls = [x.url for x in qs]
         paths = [eva.url_to_filename(x) for x in urls]
-        title = '%s @ %s' % (job.resource.data.productinstance.product.name,
-                             eva.strftime_iso8601(job.resource.data.productinstance.reference_time))
+        title = '%s @ %s' % (productinstance.product.name,
+                             eva.strftime_iso8601(productinstance.reference_time))
         xml = make_xml(title, paths)
 
         # Generate shell script
@@ -170,7 +171,7 @@ class NcMLAggregationAdapter(eva.base.adapter.BaseAdapter):
             self.api.datainstance.find_or_create_ephemeral, {
                 'data': data,
                 'expires': self.expiry_from_lifetime(),
-                'format': self.api.dataformat[self.env['output_data_format']],
+                'format': self.output_data_format,
                 'servicebackend': job.resource.servicebackend,
                 'url': 'file://' + job.output_filename,
             }
@@ -46,10 +46,13 @@ class ThreddsAdapter(eva.base.adapter.BaseAdapter):
         'input_data_format',
     ]
 
+    def adapter_init(self):
+        self.thredds_url_prefix = os.path.join(self.env['thredds_base_url'], '')
+
     def create_job(self, job):
         # Assuming that when the .html link is accessible so will be the dataset via OPeNDAP
-        basename = os.path.basename(job.resource.url)
-        job.thredds_url = os.path.join(self.env['thredds_base_url'], basename)
+        basename = job.resource.url.rpartition('/')[2]
+        job.thredds_url = self.thredds_url_prefix + basename
         job.thredds_html_url = job.thredds_url + ".html"
 
         job.command = [
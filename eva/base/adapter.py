@@ -7,6 +7,7 @@ Productstatus.
 
 
 import datetime
+import logging
 
 import eva
 import eva.config
@@ -114,20 +115,42 @@ class BaseAdapter(eva.config.ConfigurableObject, eva.globe.GlobalMixin):
         'executor',
     ]
 
+    CONFIG = dict(_COMMON_ADAPTER_CONFIG)
+    OPTIONAL_CONFIG = list(_OPTIONAL_CONFIG)
+    REQUIRED_CONFIG = list(_REQUIRED_CONFIG)
+
     PRODUCTSTATUS_REQUIRED_CONFIG = []
 
+    #: Productstatus resource types that this adapter is able to process.
+    RESOURCE_TYPES = frozenset(['datainstance'])
+
     PROCESS_PARTIAL_ONLY = 0
     PROCESS_PARTIAL_NO = 1
     PROCESS_PARTIAL_BOTH = 2
 
-    def __init__(self):
+    def __init_subclass__(cls, **kwargs):
         """
-        Class initialization will merge common configuration options with
+        Subclass creation will merge common configuration options with
         subclass-defined configuration.
         """
-        self.CONFIG.update(self._COMMON_ADAPTER_CONFIG)
-        self.OPTIONAL_CONFIG = self.OPTIONAL_CONFIG + self._OPTIONAL_CONFIG
-        self.REQUIRED_CONFIG = self.REQUIRED_CONFIG + self._REQUIRED_CONFIG
+        super().__init_subclass__(**kwargs)
+        cls._merge_common_config()
+
+    @classmethod
+    def _merge_common_config(cls):
+        """
+        Merge common configuration options into the configuration definitions
+        declared directly on this class. Definitions inherited from a parent
+        adapter class have already been merged.
+        """
+        if 'CONFIG' in cls.__dict__:
+            config = dict(cls.CONFIG)
+            config.update(BaseAdapter._COMMON_ADAPTER_CONFIG)
+            cls.CONFIG = config
+        if 'OPTIONAL_CONFIG' in cls.__dict__:
+            cls.OPTIONAL_CONFIG = list(cls.OPTIONAL_CONFIG) + BaseAdapter._OPTIONAL_CONFIG
+        if 'REQUIRED_CONFIG' in cls.__dict__:
+            cls.REQUIRED_CONFIG = list(cls.REQUIRED_CONFIG) + BaseAdapter._REQUIRED_CONFIG
 
     def init(self):
         """
@@ -136,18 +159,24 @@ class BaseAdapter(eva.config.ConfigurableObject, eva.globe.GlobalMixin):
         """
         self.logger = self.create_logger(self.logger)
 
-        self._post_to_productstatus = False
         self.blacklist = set()
         self.required_uuids = set()
         self.reference_time_threshold_delta = None
+        self.output_lifetime_delta = None
         self.template = eva.template.Environment()
 
         self._setup_process_partial()
         self._init_productstatus_output_resources()
+        self._init_input_filters()
 
         if self.env['reference_time_threshold'] != 0:
             self.reference_time_threshold_delta = datetime.timedelta(seconds=self.env['reference_time_threshold'])
 
+        if self.has_output_lifetime():
+            self.output_lifetime_delta = datetime.timedelta(hours=self.env['output_lifetime'])
+
+        self._init_productstatus_flags()
+
         if self.post_to_productstatus():
             self.logger.info('Posting to Productstatus is ENABLED.')
         else:
@@ -162,6 +191,27 @@ class BaseAdapter(eva.config.ConfigurableObject, eva.globe.GlobalMixin):
         """
         pass
 
+    def _init_input_filters(self):
+        """
+        Convert the input filter lists into sets, and store the input filter
+        settings as attributes, since they are checked against every incoming
+        resource.
+        """
+        self._input_with_hash = self.env['input_with_hash']
+        self._input_products = frozenset(self.env['input_product'])
+        self._input_service_backends = frozenset(self.env['input_service_backend'])
+        self._input_data_formats = frozenset(self.env['input_data_format'])
+        self._input_reference_hours = frozenset(self.env['input_reference_hours'])
+
+    def _init_productstatus_flags(self):
+        """
+        Evaluate whether Productstatus credentials and output configuration
+        are present. Neither can change during the lifetime of the adapter.
+        """
+        self._has_productstatus_credentials = bool(self.productstatus.has_credentials())
+        self._post_to_productstatus = self._has_productstatus_credentials and \
+            all(self.env[key] for key in self.PRODUCTSTATUS_REQUIRED_CONFIG)
+
     def _init_productstatus_output_resources(self):
         """
         Instantiate Productstatus resources referenced in output configuration.
@@ -292,76 +342,105 @@ class BaseAdapter(eva.config.ConfigurableObject, eva.globe.GlobalMixin):
         """!
         @brief Check that a Productstatus resource matches the configured
         processing criteria.
+
+        Criteria that can be checked using fields on the resource itself are
+        checked first, so that linked resources are only fetched from
+        Productstatus when strictly necessary. Debug message arguments that
+        need to be computed are only evaluated if debug logging is enabled.
         """
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+
         if resource._collection._resource_name != 'datainstance':
             self.logger.debug("%s: resource is not of type DataInstance, ignoring.", resource)
+            return False
 
-        elif not eva.in_array_or_empty(resource.data.productinstance.product.slug, self.env['input_product']):
-            self.logger.debug("%s: belongs to Product '%s', ignoring.",
-                              resource,
-                              resource.data.productinstance.product.slug)
-
-        elif not eva.in_array_or_empty(resource.servicebackend.slug, self.env['input_service_backend']):
-            self.logger.debug("%s: hosted on service backend '%s', ignoring.",
-                              resource,
-                              resource.servicebackend.name)
-
-        elif not eva.in_array_or_empty(resource.format.slug, self.env['input_data_format']):
-            self.logger.debug("%s: file type is '%s', ignoring.",
-                              resource,
-                              resource.format.name)
-
-        elif not eva.in_array_or_empty(resource.data.productinstance.reference_time.strftime('%H'), self.env['input_reference_hours']):
-            self.logger.debug("%s: ProductInstance reference hour does not match any of %s, ignoring.",
-                              resource,
-                              list(set(self.env['input_reference_hours'])))
-
-        elif self.reference_time_threshold() > resource.data.productinstance.reference_time:
-            self.logger.debug("%s: ProductInstance reference time is older than threshold of %s, ignoring.",
-                              resource,
-                              self.reference_time_threshold())
-
-        elif resource.deleted:
+        if resource.deleted:
             self.logger.debug("%s: marked as deleted, ignoring.",
                               resource)
+            return False
 
-        elif not self.resource_matches_hash_config(resource):
+        if not self.resource_matches_hash_config(resource):
             self.logger.debug("%s: resource has hash, and adapter is configured to not process instances with hashes, or vice versa; ignoring.",
                               resource)
+            return False
 
-        elif resource.partial and self.process_partial == self.PROCESS_PARTIAL_NO and not productstatus.datainstance_has_complete_file_count(resource):
-            self.logger.debug("%s: resource is incomplete; ignoring.",
-                              resource)
-
-        elif resource.partial and self.process_partial == self.PROCESS_PARTIAL_ONLY and productstatus.datainstance_has_complete_file_count(resource):
-            self.logger.debug("%s: resource is complete; ignoring.",
-                              resource)
-
-        elif self.is_blacklisted(resource.id):
+        if self.is_blacklisted(resource.id):
             self.logger.debug("%s: resource is blacklisted, ignoring.",
                               resource)
-
-        elif self.is_blacklisted(resource.data.id):
+            return False
+
+        servicebackend = resource.servicebackend
+        if not eva.in_array_or_empty(servicebackend.slug, self._input_service_backends):
+            if debug:
+                self.logger.debug("%s: hosted on service backend '%s', ignoring.",
+                                  resource,
+                                  servicebackend.name)
+            return False
+
+        data_format = resource.format
+        if not eva.in_array_or_empty(data_format.slug, self._input_data_formats):
+            if debug:
+                self.logger.debug("%s: file type is '%s', ignoring.",
+                                  resource,
+                                  data_format.name)
+            return False
+
+        data = resource.data
+        if self.is_blacklisted(data.id):
             self.logger.debug("%s: resource Data %s is blacklisted, ignoring.",
                               resource,
-                              resource.data)
+                              data)
+            return False
 
-        elif self.is_blacklisted(resource.data.productinstance.id):
+        productinstance = data.productinstance
+        if self.is_blacklisted(productinstance.id):
             self.logger.debug("%s: ProductInstance %s is blacklisted, ignoring.",
                               resource,
-                              resource.data.productinstance)
+                              productinstance)
+            return False
+
+        reference_time = productinstance.reference_time
+        if not eva.in_array_or_empty(reference_time.hour, self._input_reference_hours):
+            if debug:
+                self.logger.debug("%s: ProductInstance reference hour does not match any of %s, ignoring.",
+                                  resource,
+                                  sorted(self._input_reference_hours))
+            return False
+
+        threshold = self.reference_time_threshold()
+        if threshold > reference_time:
+            self.logger.debug("%s: ProductInstance reference time is older than threshold of %s, ignoring.",
+                              resource,
+                              threshold)
+            return False
 
-        elif not self.datainstance_has_required_uuids(resource):
-            self.logger.debug("%s: resource does not have any relationships to required UUIDs %s, ignoring.",
+        product_slug = productinstance.product.slug
+        if not eva.in_array_or_empty(product_slug, self._input_products):
+            self.logger.debug("%s: belongs to Product '%s', ignoring.",
                               resource,
-                              list(self.required_uuids))
+                              product_slug)
+            return False
 
-        else:
-            self.clear_required_uuids()
-            self.logger.info("%s matches all configured criteria.", resource)
-            return True
+        if resource.partial and self.process_partial == self.PROCESS_PARTIAL_NO and not productstatus.datainstance_has_complete_file_count(resource):
+            self.logger.debug("%s: resource is incomplete; ignoring.",
+                              resource)
+            return False
 
-        return False
+        if resource.partial and self.process_partial == self.PROCESS_PARTIAL_ONLY and productstatus.datainstance_has_complete_file_count(resource):
+            self.logger.debug("%s: resource is complete; ignoring.",
+                              resource)
+            return False
+
+        if not self.datainstance_has_required_uuids(resource):
+            if debug:
+                self.logger.debug("%s: resource does not have any relationships to required UUIDs %s, ignoring.",
+                                  resource,
+                                  list(self.required_uuids))
+            return False
+
+        self.clear_required_uuids()
+        self.logger.info("%s matches all configured criteria.", resource)
+        return True
 
     def validate_resource(self, resource):
         """
@@ -396,12 +475,6 @@ class BaseAdapter(eva.config.ConfigurableObject, eva.globe.GlobalMixin):
         @brief Returns True if this adapter has sufficient configuration to be
         able to post to Productstatus, False otherwise.
         """
-        if self.productstatus.has_credentials():
-            self._post_to_productstatus = True
-            for key in self.PRODUCTSTATUS_REQUIRED_CONFIG:
-                if not self.env[key]:
-                    self._post_to_productstatus = False
-                    break
         return self._post_to_productstatus
 
     def resource_matches_hash_config(self, resource):
@@ -412,11 +485,11 @@ class BaseAdapter(eva.config.ConfigurableObject, eva.globe.GlobalMixin):
         * DataInstance.hash populated, and input_with_hash is set to YES
         * input_with_hash is unset
         """
-        if self.env['input_with_hash'] is None:
+        if self._input_with_hash is None:
             return True
-        if resource.hash is None and self.env['input_with_hash'] is False:
+        if resource.hash is None and self._input_with_hash is False:
             return True
-        if resource.hash is not None and self.env['input_with_hash'] is True:
+        if resource.hash is not None and self._input_with_hash is True:
             return True
         return False
 
@@ -425,7 +498,7 @@ class BaseAdapter(eva.config.ConfigurableObject, eva.globe.GlobalMixin):
         @return True if the adapter is configured with a user name and API key
         to Productstatus, False otherwise.
         """
-        return self.productstatus.has_credentials()
+        return self._has_productstatus_credentials
 
     def require_productstatus_credentials(self):
         """!
@@ -452,9 +525,9 @@ class BaseAdapter(eva.config.ConfigurableObject, eva.globe.GlobalMixin):
         time, based on the output_lifetime environment variable. If the
         variable is not set, this function returns None.
         """
-        if not self.has_output_lifetime():
+        if self.output_lifetime_delta is None:
             return None
-        return self.expiry_from_hours(hours=self.env['output_lifetime'])
+        return eva.now_with_timezone() + self.output_lifetime_delta
 
     @staticmethod
     def default_resource_dictionary():
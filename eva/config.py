@@ -6,10 +6,22 @@ of objects from a configuration file.
 import eva.exceptions
 
 
-#: list of configuration options that shall be censored from log output.
-SECRET_CONFIGURATION = [
+#: set of configuration options that shall be censored from log output.
+SECRET_CONFIGURATION = frozenset([
     'api_key',
-]
+])
+
+#: mapping of lower-case configuration strings to boolean values.
+BOOLEAN_VALUES = {
+    'yes': True,
+    'true': True,
+    'on': True,
+    '1': True,
+    'no': False,
+    'false': False,
+    'off': False,
+    '0': False,
+}
 
 
 def resolved_config_section(config, section, section_keys=None, ignore_defaults=False):
@@ -40,14 +52,15 @@ def resolved_config_section(config, section, section_keys=None, ignore_defaults=
 
     if section not in config:
         raise eva.exceptions.MissingConfigurationSectionException("Configuration section '%s' was not found." % section)
+    section_config = config[section]
 
     if not ignore_defaults:
-        section_defaults = 'defaults.' + section.split('.')[0]
+        section_defaults = 'defaults.' + section.partition('.')[0]
         if section_defaults in config:
             resolved.update(resolved_config_section(config, section_defaults, section_keys=section_keys, ignore_defaults=True))
 
-    if 'include' in config[section]:
-        sections = eva.config.ConfigurableObject.normalize_config_list_string(config[section]['include'])
+    if 'include' in section_config:
+        sections = eva.config.ConfigurableObject.normalize_config_list_string(section_config['include'])
         for base_section in sections:
             resolved.update(resolved_config_section(config, base_section, section_keys=section_keys, ignore_defaults=True))
 
@@ -55,7 +68,7 @@ def resolved_config_section(config, section, section_keys=None, ignore_defaults=
         if key in resolved:
             del resolved[key]
 
-    resolved.update(config[section])
+    resolved.update(section_config)
 
     for key in ['include']:
         if key in resolved:
@@ -273,12 +286,7 @@ class ConfigurableObject(object):
 
         :rtype: bool|None
         """
-        value = value.lower()
-        if value in ['yes', 'true', 'on', '1']:
-            return True
-        if value in ['no', 'false', 'off', '0']:
-            return False
-        return None
+        return BOOLEAN_VALUES.get(value.lower())
 
     @staticmethod
     def normalize_config_bool(value):
@@ -338,9 +346,9 @@ class ConfigurableObject(object):
         :param dict config_classes: dictionary with configuration IDs (see :attr:`config_id`) as keys pointing to :class:`ResolvableDependency` objects.
         :rtype: class
         """
-        for key in self.env.keys():
-            if isinstance(self.env[key], ResolvableDependency):
-                self.env[key] = self.env[key].resolve(config_classes)
+        for key, value in self.env.items():
+            if isinstance(value, ResolvableDependency):
+                self.env[key] = value.resolve(config_classes)
 
     def load_configuration(self, config):
         """
@@ -354,8 +362,15 @@ class ConfigurableObject(object):
         """
         #: dictionary of normalized configuration variables, as read from the configuration file.
         self.env = {}
-        keys = list(set(self.REQUIRED_CONFIG + self.OPTIONAL_CONFIG))
-        configured = []
+        keys = list(set(self.REQUIRED_CONFIG).union(self.OPTIONAL_CONFIG))
+        configured = set()
+
+        # Report all missing required variables at once
+        missing = set(self.REQUIRED_CONFIG).difference(config)
+        if missing:
+            raise eva.exceptions.MissingConfigurationException(
+                "Missing required configuration variables: %s" % ', '.join(sorted(missing))
+            )
 
         # Iterate through required and optional config, and read only those variables
         for key in keys:
@@ -364,18 +379,11 @@ class ConfigurableObject(object):
                     "Missing configuration option '%s' in class CONFIG hash, please fix your code!" % key
                 )
 
-            # Read default value and enforce requirements
-            found = key in config
-            if found:
+            # Read default value; required variables are known to be present
+            if key in config:
                 value = config[key]
-
-            if not found:
-                if key in self.REQUIRED_CONFIG:
-                    raise eva.exceptions.MissingConfigurationException(
-                        "Missing required configuration variable '%s'" % key
-                    )
-                if key in self.OPTIONAL_CONFIG:
-                    value = self.CONFIG[key]['default']
+            else:
+                value = self.CONFIG[key]['default']
 
             # Normalize configuration option
             option_type = self.CONFIG[key]['type']
@@ -391,7 +399,7 @@ class ConfigurableObject(object):
 
             # Write normalized value into configuration hash
             self.env[key] = value
-            configured += [key]
+            configured.add(key)
 
         # Check for extraneous options, and raise an exception if a non-defined key is set
         for key in config:
@@ -31,6 +31,9 @@ class Eventloop(eva.globe.GlobalMixin):
     # Allow maximum 60 seconds since last heartbeat before reporting process unhealthy
     HEALTH_CHECK_HEARTBEAT_TIMEOUT = 60
 
+    # Maximum number of events received from each listener per main loop iteration
+    POLL_BATCH_SIZE = 100
+
     def __init__(self,
                  adapters,
                  listeners,
@@ -151,78 +154,87 @@ class Eventloop(eva.globe.GlobalMixin):
     def poll_listeners(self):
         """!
         @brief Poll for new messages from all message listeners.
+
+        All immediately available messages, up to `POLL_BATCH_SIZE`, are
+        received from each listener, and the listener position is
+        acknowledged once for the entire batch.
         """
         timer = self.statsd.timer('eva_poll_listeners')
         timer.start()
 
         for listener in self.listeners:
-            try:
-                event = listener.get_next_event()
-                assert isinstance(event, eva.event.Event)
-            except eva.exceptions.EventTimeoutException:
-                continue
-            except eva.exceptions.InvalidEventException as e:
-                self.logger.debug('Received invalid event: %s', e)
-                continue
-            except self.RECOVERABLE_EXCEPTIONS as e:
-                self.logger.warning('Exception while receiving event: %s', e)
-                continue
-
-            self.statsd.incr('eva_event_received')
-
-            # Accept heartbeats without adding them to queue
-            if isinstance(event, eva.event.ProductstatusHeartbeatEvent):
-                self.logger.debug('%s: heartbeat received', event)
+            received = 0
+            for _ in range(self.POLL_BATCH_SIZE):
+                try:
+                    event = listener.get_next_event()
+                    assert isinstance(event, eva.event.Event)
+                except eva.exceptions.EventTimeoutException:
+                    break
+                except eva.exceptions.InvalidEventException as e:
+                    self.logger.debug('Received invalid event: %s', e)
+                    continue
+                except self.RECOVERABLE_EXCEPTIONS as e:
+                    self.logger.warning('Exception while receiving event: %s', e)
+                    break
+                received += 1
+                self.add_received_event(event)
+            if received > 0:
                 listener.acknowledge()
-                self.statsd.incr('eva_event_heartbeat')
-                self.set_health_check_timestamp(eva.now_with_timezone())
-                continue
 
-            # Discard 'expired' events
-            if isinstance(event, eva.event.ProductstatusExpiredEvent):
-                self.logger.debug('%s: expired event received', event)
-                listener.acknowledge()
-                self.statsd.incr('eva_event_expired')
-                continue
+        timer.stop()
 
-            # Print to log
-            self.logger.info('%s: event received', event)
+    def add_received_event(self, event):
+        """!
+        @brief Add an event received from a message listener to the event
+        queue, unless it is a heartbeat, expired, or otherwise invalid.
+        """
+        self.statsd.incr('eva_event_received')
 
-            # Reject messages that are too old
-            if event.timestamp() < self.message_timestamp_threshold:
-                listener.acknowledge()
-                self.statsd.incr('eva_event_too_old')
-                self.logger.warning('Skip processing event because resource is older than threshold: %s vs %s',
-                                    event.timestamp(),
-                                    self.message_timestamp_threshold)
+        # Accept heartbeats without adding them to queue
+        if isinstance(event, eva.event.ProductstatusHeartbeatEvent):
+            self.logger.debug('%s: heartbeat received', event)
+            self.statsd.incr('eva_event_heartbeat')
+            self.set_health_check_timestamp(eva.now_with_timezone())
+            return
 
-            # Checks for real Productstatus events from the message queue
-            if type(event) is eva.event.ProductstatusResourceEvent:
+        # Discard 'expired' events
+        if isinstance(event, eva.event.ProductstatusExpiredEvent):
+            self.logger.debug('%s: expired event received', event)
+            self.statsd.incr('eva_event_expired')
+            return
 
-                self.statsd.incr('eva_event_productstatus')
+        # Print to log
+        self.logger.info('%s: event received', event)
 
-                # Only process messages with the correct version
-                if event.protocol_version()[0] != 1:
-                    self.logger.warning('Event version is %s, but I am only accepting major version 1. Discarding message.', '.'.join(event.protocol_version()))
-                    self.statsd.incr('eva_event_version_unsupported')
-                    listener.acknowledge()
-                    continue
+        # Reject messages that are too old
+        if event.timestamp() < self.message_timestamp_threshold:
+            self.statsd.incr('eva_event_too_old')
+            self.logger.warning('Skip processing event because resource is older than threshold: %s vs %s',
+                                event.timestamp(),
+                                self.message_timestamp_threshold)
 
-            # Add message to event queue
-            try:
-                item = self.event_queue.add_event(event)
+        # Checks for real Productstatus events from the message queue
+        if type(event) is eva.event.ProductstatusResourceEvent:
+
+            self.statsd.incr('eva_event_productstatus')
 
-                # All adapters should process this event by default
-                item.set_adapters(self.adapters)
+            # Only process messages with the correct version
+            if event.protocol_version()[0] != 1:
+                self.logger.warning('Event version is %s, but I am only accepting major version 1. Discarding message.', '.'.join(event.protocol_version()))
+                self.statsd.incr('eva_event_version_unsupported')
+                return
 
-            except eva.exceptions.DuplicateEventException as e:
-                self.statsd.incr('eva_event_duplicate')
-                self.logger.warning(e)
-                self.logger.warning('This is most probably due to a previous Kafka commit error. The message has been discarded.')
+        # Add message to event queue
+        try:
+            item = self.event_queue.add_event(event)
 
-            listener.acknowledge()
+            # All adapters should process this event by default
+            item.set_adapters(self.adapters)
 
-        timer.stop()
+        except eva.exceptions.DuplicateEventException as e:
+            self.statsd.incr('eva_event_duplicate')
+            self.logger.warning(e)
+            self.logger.warning('This is most probably due to a previous Kafka commit error. The message has been discarded.')
 
     def next_event_queue_item(self):
         """!
@@ -313,10 +325,11 @@ class Eventloop(eva.globe.GlobalMixin):
         for job in item:
 
             try:
-                # Only process N active jobs at a time
+                # Only process N active jobs at a time. Counting active jobs
+                # requires a scan of the entire event queue, so only do it
+                # for jobs that have not been started yet.
                 job_active = (not job.initialized()) and (not job.ready())
-                has_capacity = job.adapter.concurrency > self.event_queue.adapter_active_job_count(job.adapter)
-                if job_active or has_capacity:
+                if job_active or job.adapter.concurrency > self.event_queue.adapter_active_job_count(job.adapter):
                     self.process_job(job)
 
             except self.RECOVERABLE_EXCEPTIONS as e:
@@ -571,8 +584,14 @@ class Eventloop(eva.globe.GlobalMixin):
 
         self.logger.info('%s: start generating jobs', item)
 
+        resource_type = item.event.resource._collection._resource_name
+
         for adapter in item.adapters:
-            job = self.create_job_for_event_queue_item(item, adapter)
+            # Skip adapters that cannot process this type of resource at all
+            if resource_type not in adapter.RESOURCE_TYPES:
+                job = None
+            else:
+                job = self.create_job_for_event_queue_item(item, adapter)
 
             if job is None:
                 self.statsd.incr('eva_event_rejected', tags={'adapter': adapter.config_id})
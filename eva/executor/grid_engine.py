@@ -23,12 +23,18 @@ SSH_RETRY_EXCEPTIONS = (paramiko.ssh_exception.NoValidConnectionsError,
                         )
 EXIT_OK = 0
 
+JOB_GROUP_ID_REGEX = re.compile(r'[^a-zA-Z0-9]')
+QSUB_JOB_ID_REGEX = re.compile(r'\d+')
+QSTAT_JOB_NUMBER_REGEX = re.compile(r'^job_number:\s+(\d+)\s*$')
+QACCT_EXIT_STATUS_REGEX = re.compile(r'^exit_status\s+(\d+)\s*$')
+QACCT_METRIC_REGEX = re.compile(r'^([\w_]+)\s+(.+)$')
+
 
 def create_job_unique_id(group_id, job_id):
     """!
     @brief Given a EVA group_id and a job UUID, returns a valid job id for GridEngine.
     """
-    return u'eva.' + re.sub(r'[^a-zA-Z0-9]', u'-', group_id).strip(u'-') + u'.' + str(job_id)
+    return u'eva.' + JOB_GROUP_ID_REGEX.sub(u'-', group_id).strip(u'-') + u'.' + str(job_id)
 
 
 def get_job_id_from_qsub_output(output):
@@ -37,7 +43,7 @@ def get_job_id_from_qsub_output(output):
     option to make it explicitly machine readable, so we use a regular
     expression to extract the first number instead.
     """
-    matches = re.search('\d+', output)
+    matches = QSUB_JOB_ID_REGEX.search(output)
     if not matches:
         raise eva.exceptions.GridEngineParseException('Unparseable output from qsub: expected job id, but no digits in output: %s' % output)
     return int(matches.group(0))
@@ -47,9 +53,8 @@ def get_job_id_from_qstat_output(output):
     """!
     @brief Parse the JOB_ID from qstat output using a regular expression.
     """
-    regex = re.compile('^job_number:\s+(\d+)\s*$')
     for line in output.splitlines():
-        matches = regex.match(line)
+        matches = QSTAT_JOB_NUMBER_REGEX.match(line)
         if matches:
             return int(matches.group(1))
     raise eva.exceptions.GridEngineParseException('Could not parse job_number from qstat output.')
@@ -74,9 +79,8 @@ def get_exit_code_from_qacct_output(output):
     """!
     @brief Parse the job exit code from qacct output using a regular expression.
     """
-    regex = re.compile('^exit_status\s+(\d+)\s*$')
     for line in output.splitlines():
-        matches = regex.match(line)
+        matches = QACCT_EXIT_STATUS_REGEX.match(line)
         if matches:
             return int(matches.group(1))
     raise eva.exceptions.GridEngineParseException('Could not parse exit_code from qacct output.')
@@ -91,10 +95,8 @@ def parse_qacct_metrics(stdout_lines):
     tags = {}
     parsed = {}
 
-    base_regex = re.compile('^([\w_]+)\s+(.+)$')
-
     for line in stdout_lines:
-        matches = base_regex.match(line)
+        matches = QACCT_METRIC_REGEX.match(line)
         if not matches:
             continue
         parsed[matches.group(1)] = matches.group(2).strip()
@@ -432,7 +434,7 @@ class GridEngineExecutor(eva.base.executor.BaseExecutor):
         job.logger.debug('Running: %s', check_command)
         exit_code, stdout, stderr = self.execute_ssh_command(check_command)
         if exit_code != EXIT_OK:
-            job.logger.debug('Exit code %d' % exit_code)
+            job.logger.debug('Exit code %d', exit_code)
             job.logger.debug(stdout)
             job.logger.debug(stderr)
             raise JobNotFinishedException('Job %d is not present in qacct output.' % job.pid)
@@ -511,7 +513,7 @@ class GridEngineExecutor(eva.base.executor.BaseExecutor):
         if exit_code == 0:
             job.logger.info('Job successfully submitted for deletion.')
         else:
-            job.logger.warning('Job deletion failed with exit code %d.' % exit_code)
+            job.logger.warning('Job deletion failed with exit code %d.', exit_code)
             job.logger.warning('Ignoring error condition. Standand output and standard error of delete command follows.')
             eva.executor.log_stdout_stderr(job, job.stdout, job.stderr)
 
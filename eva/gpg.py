@@ -12,6 +12,10 @@ import subprocess
 import tempfile
 
 
+SIGNATURE_REGEX = re.compile(r'^gpg: Signature made (.+) using (.+) key ID ([\w\d]+)$')
+SIGNER_REGEX = re.compile(r'^gpg: Good signature from "(.+)"$')
+
+
 class GPGSignatureCheckResult(object):
     def __init__(self, exit_code, stdout, stderr):
         self.exit_code = exit_code
@@ -24,15 +28,13 @@ class GPGSignatureCheckResult(object):
         self.parse_stderr()
 
     def parse_stderr(self):
-        re_signature = re.compile('^gpg: Signature made (.+) using (.+) key ID ([\w\d]+)$')
-        re_signer = re.compile('^gpg: Good signature from "(.+)"$')
         for line in self.stderr:
-            matches = re_signature.match(line)
+            matches = SIGNATURE_REGEX.match(line)
             if matches:
                 self.timestamp = dateutil.parser.parse(matches.group(1))
                 self.key_type = matches.group(2)
                 self.key_id = matches.group(3)
-            matches = re_signer.match(line)
+            matches = SIGNER_REGEX.match(line)
             if matches:
                 self.signer = matches.group(1)
 
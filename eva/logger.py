@@ -3,6 +3,7 @@
 """
 
 import logging
+import time
 
 
 class WildcardLogFilter(logging.Filter):
@@ -17,6 +18,28 @@ class WildcardLogFilter(logging.Filter):
         return True
 
 
+class CachingFormatter(logging.Formatter):
+    """
+    This formatter caches the formatted timestamp, so that `strftime` is only
+    called once per second instead of once per log record.
+
+    Date formats with a finer resolution than one second are not supported.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._time_cache = (None, None, None)
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        cached_second, cached_datefmt, formatted = self._time_cache
+        if second != cached_second or datefmt != cached_datefmt:
+            formatted = time.strftime(datefmt or self.default_time_format, self.converter(record.created))
+            self._time_cache = (second, datefmt, formatted)
+        if datefmt:
+            return formatted
+        return self.default_msec_format % (formatted, record.msecs)
+
+
 class AdapterLogAdapter(logging.LoggerAdapter):
     """
     @brief This adapter prepends the job adapter ID in brackets to all log messages.
@@ -37,7 +37,7 @@ class StatsDClient(object):
             connection = {
                 'host': host,
                 'port': int(port),
-                'socket': socket.socket(socket.AF_INET, socket.SOCK_DGRAM),
+                'socket': None,
             }
             self.connections += [connection]
 
@@ -63,6 +63,8 @@ class StatsDClient(object):
         @brief Send a message using UDP to all configured endpoints.
         """
         for connection in self.connections:
+            if connection['socket'] is None:
+                connection['socket'] = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             connection['socket'].sendto(message.encode('ascii'), (connection['host'], connection['port']))
 
     def appended_tags(self, tags):
@@ -30,14 +30,40 @@ input_with_hash = NO
         """
         self.create_adapter()
         resource = mock.MagicMock()
+        resource.url = 'file:///foo/bar.nc'
         self.create_job(resource)
 
+    def test_create_job_reads_hash_file_once(self):
+        """!
+        @brief Test that the job script reads the hash file only once.
+        """
+        self.create_adapter()
+        resource = mock.MagicMock()
+        resource.url = 'file:///foo/bar.nc'
+        job = self.create_job(resource)
+        script = '\n'.join(job.command)
+        self.assertEqual(script.count('/foo/bar.nc.md5'), 1)
+        self.assertIn('md5sum --check', script)
+
+    def test_create_job_quotes_filenames(self):
+        """!
+        @brief Test that file names are quoted in the job script.
+        """
+        self.create_adapter()
+        resource = mock.MagicMock()
+        resource.url = 'file:///foo/bar baz.nc'
+        job = self.create_job(resource)
+        script = '\n'.join(job.command)
+        self.assertIn("'/foo/bar baz.nc.md5'", script)
+        self.assertIn("'/foo/bar baz.nc'", script)
+
     def test_finish_job_failed(self):
         """!
         @brief Test that the adapter skips failed jobs.
         """
         self.create_adapter()
         resource = mock.MagicMock()
+        resource.url = 'file:///foo/bar.nc'
         job = self.create_job(resource)
         job.set_status(eva.job.FAILED)
         with self.assertRaises(eva.exceptions.RetryException):
@@ -49,6 +75,7 @@ input_with_hash = NO
         """
         self.create_adapter()
         resource = mock.MagicMock()
+        resource.url = 'file:///foo/bar.nc'
         job = self.create_job(resource)
         job.set_status(eva.job.COMPLETE)
         md5sum = '401b30e3b8b5d629635a5c613cdb7919'
@@ -77,3 +104,18 @@ input_with_hash = NO
         ]
         md5 = eva.adapter.checksum.job_output_md5sum(stdout)
         self.assertIsNone(md5)
+
+    def test_find_md5sum_not_hex(self):
+        stdout = [
+            "eva.adapter.checksum.md5 401b30e3b8b5d629635a5c613cdb791z",
+        ]
+        md5 = eva.adapter.checksum.job_output_md5sum(stdout)
+        self.assertIsNone(md5)
+
+    def test_find_md5sum_trailing_whitespace(self):
+        check = '401b30e3b8b5d629635a5c613cdb7919'
+        stdout = [
+            "eva.adapter.checksum.md5 " + check + "\n",
+        ]
+        md5 = eva.adapter.checksum.job_output_md5sum(stdout)
+        self.assertEqual(md5, check)
@@ -101,3 +101,117 @@ input_service_backend = nil
         self.assertEqual(len(resources['productinstance']), 1)
         self.assertEqual(len(resources['data']), 2)
         self.assertEqual(len(resources['datainstance']), 2)
+
+    def test_generate_resources_shared_data(self):
+        """!
+        @brief Test that output files with the same time period share a
+        single Data resource.
+        """
+        with httmock.HTTMock(*eva.tests.schemas.SCHEMAS):
+            self.create_adapter()
+
+        self.adapter.output_product = mock.MagicMock()
+        self.adapter.output_data_format = mock.MagicMock()
+        self.adapter.output_service_backend = mock.MagicMock()
+        self.adapter.nml_data_format = mock.MagicMock()
+
+        resource = mock.MagicMock()
+        job = self.create_job(resource)
+        job.stdout = [
+            '===eva.adapter.cwf===',
+            '/tmp/meteo20160606_00.nc  time = "2016-06-06 12", "2016-06-07" ;',
+            '/tmp/meteo20160606_01.nc  time = "2016-06-06 12", "2016-06-07" ;',
+            '/tmp/meteo20160606_00.nml',
+            '/tmp/meteo20160606_01.nml',
+        ]
+        job.output_files = self.adapter.parse_file_recognition_output(job.stdout)
+        job.resource.data.productinstance.reference_time = eva.coerce_to_utc(datetime.datetime(2016, 6, 6, 12))
+
+        with httmock.HTTMock(*eva.tests.schemas.SCHEMAS):
+            resources = self.generate_resources(job)
+
+        self.assertEqual(len(resources['data']), 2)
+        self.assertEqual(len(resources['datainstance']), 4)
+        self.assertEqual(resources['data'][0].args[0]['time_period_end'],
+                         eva.coerce_to_utc(datetime.datetime(2016, 6, 7)))
+        self.assertEqual(resources['data'][1].args[0]['time_period_end'], None)
+
+    def test_init_empty_lifetime(self):
+        """!
+        @brief Test that the adapter requires at least one DataInstance lifetime.
+        """
+        self.config['adapter']['cwf_lifetime'] = ''
+        with self.assertRaises(eva.exceptions.InvalidConfigurationException):
+            with httmock.HTTMock(*eva.tests.schemas.SCHEMAS):
+                self.create_adapter()
+
+    def test_generate_resources_expiry(self):
+        """!
+        @brief Test that DataInstance lifetimes are assigned in file order,
+        and that NML files get the shortest lifetime.
+        """
+        with httmock.HTTMock(*eva.tests.schemas.SCHEMAS):
+            self.create_adapter()
+
+        self.adapter.output_product = mock.MagicMock()
+        self.adapter.output_data_format = mock.MagicMock()
+        self.adapter.output_service_backend = mock.MagicMock()
+        self.adapter.nml_data_format = mock.MagicMock()
+
+        resource = mock.MagicMock()
+        job = self.create_job(resource)
+        job.stdout = [
+            '===eva.adapter.cwf===',
+            '/tmp/meteo20160606_00.nc  time = "2016-06-06 12", "2016-06-07" ;',
+            '/tmp/meteo20160607_00.nc  time = "2016-06-07 12", "2016-06-08" ;',
+            '/tmp/meteo20160608_00.nc  time = "2016-06-08 12", "2016-06-09" ;',
+            '/tmp/meteo20160606_00.nml',
+        ]
+        job.output_files = self.adapter.parse_file_recognition_output(job.stdout)
+        job.resource.data.productinstance.reference_time = eva.coerce_to_utc(datetime.datetime(2016, 6, 6, 12))
+
+        now = eva.now_with_timezone()
+        with httmock.HTTMock(*eva.tests.schemas.SCHEMAS):
+            resources = self.generate_resources(job)
+
+        hours = [round((x.expires - now).total_seconds() / 3600) for x in resources['datainstance']]
+        self.assertListEqual(hours, [72, 24, 24, 24])
+
+    def test_create_job_parallel(self):
+        """!
+        @brief Test that parallel processing is requested from the job
+        scheduler and passed on to the CWF script.
+        """
+        self.config['adapter']['cwf_parallel'] = '2'
+        with httmock.HTTMock(*eva.tests.schemas.SCHEMAS):
+            self.create_adapter()
+        resource = mock.MagicMock()
+        resource.url = 'file:///foo/bar.nc'
+        resource.data.productinstance.reference_time = eva.coerce_to_utc(datetime.datetime(2016, 6, 6, 12))
+        job = self.create_job(resource)
+        self.assertEqual(job.command[0], '#$ -pe mpi-fn 2')
+        self.assertIn('export ECDIS_PARALLEL=1', job.command)
+        self.assertIn('export ECDIS=/foo/bar.nc', job.command)
+        self.assertIn('export OUTDIR=/tmp/20160606T120000Z', job.command)
+
+    def test_generate_resources_unsupported_format(self):
+        """!
+        @brief Test that output files of unknown types are rejected.
+        """
+        with httmock.HTTMock(*eva.tests.schemas.SCHEMAS):
+            self.create_adapter()
+
+        self.adapter.output_product = mock.MagicMock()
+        self.adapter.output_service_backend = mock.MagicMock()
+
+        resource = mock.MagicMock()
+        job = self.create_job(resource)
+        job.output_files = self.adapter.parse_file_recognition_output([
+            '===eva.adapter.cwf===',
+            '/tmp/meteo20160606_00.grb',
+        ])
+        self.assertEqual(job.output_files[0]['extension'], '.grb')
+        with self.assertRaises(RuntimeError) as e:
+            with httmock.HTTMock(*eva.tests.schemas.SCHEMAS):
+                self.generate_resources(job)
+        self.assertIn('.grb', str(e.exception))
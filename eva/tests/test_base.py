@@ -21,6 +21,24 @@ class TestBase(eva.tests.TestBase):
         array = ['a', 'b', 'c']
         self.assertFalse(eva.in_array_or_empty('x', array))
 
+    def test_in_array_or_empty_none(self):
+        self.assertTrue(eva.in_array_or_empty('y', None))
+
+    def test_in_array_or_empty_frozenset(self):
+        array = frozenset(['a', 'b', 'c'])
+        self.assertTrue(eva.in_array_or_empty('b', array))
+        self.assertFalse(eva.in_array_or_empty('x', array))
+        self.assertTrue(eva.in_array_or_empty('x', frozenset()))
+
+    def test_import_module_class(self):
+        class_type = eva.import_module_class('eva.executor.NullExecutor')
+        self.assertIs(class_type, eva.executor.NullExecutor)
+        self.assertIs(eva.import_module_class('eva.executor.NullExecutor'), class_type)
+
+    def test_import_module_class_missing(self):
+        with self.assertRaises(AttributeError):
+            eva.import_module_class('eva.executor.NonExistentExecutor')
+
     def test_url_to_filename(self):
         url = 'file:///foo/bar/baz.nc'
         filename = '/foo/bar/baz.nc'
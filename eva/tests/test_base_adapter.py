@@ -54,6 +54,15 @@ class TestBaseAdapter(eva.tests.BaseTestAdapter):
         self.assertIn('test_foo', self.adapter.CONFIG.keys())
         self.assertIn('input_data_format', self.adapter.CONFIG.keys())
 
+    def test_common_configuration_not_shared(self):
+        """!
+        @brief Test that merging the common adapter configuration does not
+        modify the configuration of unrelated classes.
+        """
+        self.create_adapter()
+        self.assertNotIn('input_product', eva.config.ConfigurableObject.CONFIG)
+        self.assertNotIn('input_product', eva.executor.NullExecutor.CONFIG)
+
     def test_required_configuration_keys(self):
         class Foo(eva.adapter.BaseAdapter):
             REQUIRED_CONFIG = [
@@ -103,6 +112,18 @@ class TestBaseAdapter(eva.tests.BaseTestAdapter):
         self.create_adapter()
         self.assertFalse(self.adapter.has_productstatus_credentials())
 
+    def test_productstatus_flags_evaluated_once(self):
+        """!
+        @brief Test that Productstatus credentials are only checked when the
+        adapter is initialized.
+        """
+        self.setup_productstatus()
+        self.create_adapter()
+        self.productstatus.has_credentials = mock.Mock(return_value=False)
+        self.assertTrue(self.adapter.has_productstatus_credentials())
+        self.assertEqual(self.adapter.post_to_productstatus(), self.adapter.post_to_productstatus())
+        self.productstatus.has_credentials.assert_not_called()
+
     def test_require_productstatus_credentials(self):
         self.create_adapter()
         with self.assertRaises(RuntimeError):
@@ -243,3 +264,22 @@ class TestBaseAdapter(eva.tests.BaseTestAdapter):
         self.assertTrue(self.adapter.resource_matches_hash_config(resource))
         resource.hash = 'd3b07384d113edec49eaa6238ad5ff00'
         self.assertFalse(self.adapter.resource_matches_hash_config(resource))
+
+    def test_resource_matches_input_config_reference_hours(self):
+        """!
+        @brief Test that the input_reference_hours option filters resources
+        by the ProductInstance reference hour.
+        """
+        resource = mock.MagicMock()
+        resource._collection._resource_name = 'datainstance'
+        resource.data.productinstance.reference_time = eva.now_with_timezone().replace(hour=12)
+        resource.deleted = False
+        resource.partial = False
+
+        self.config['adapter']['input_reference_hours'] = '0,12'
+        self.create_adapter()
+        self.assertTrue(self.adapter.resource_matches_input_config(resource))
+
+        self.config['adapter']['input_reference_hours'] = '0,6,18'
+        self.create_adapter()
+        self.assertFalse(self.adapter.resource_matches_input_config(resource))
@@ -1,4 +1,5 @@
 import configparser
+import types
 
 import eva.config
 import eva.event
@@ -189,3 +190,62 @@ string = bar
         self.assertFalse(eva.config.ConfigurableObject.normalize_config_bool('OFF'))
         self.assertFalse(eva.config.ConfigurableObject.normalize_config_bool('off'))
         self.assertFalse(eva.config.ConfigurableObject.normalize_config_bool('0'))
+
+    def test_frozen_config_definitions(self):
+        """
+        Test that configuration definitions may be declared as immutable types.
+        """
+        class FrozenConfigObject(eva.config.ConfigurableObject):
+            CONFIG = types.MappingProxyType(MockConfigObject.CONFIG)
+            REQUIRED_CONFIG = frozenset(MockConfigObject.REQUIRED_CONFIG)
+            OPTIONAL_CONFIG = frozenset(MockConfigObject.OPTIONAL_CONFIG)
+
+        config = \
+"""
+[object]
+string = bar
+"""  # NOQA
+        self.setup_with_config(FrozenConfigObject, config, 'object')
+        self.assertEqual(self.object_.env['string'], 'bar')
+        self.assertEqual(self.object_.env['int'], -9)
+
+    def test_format_config_censored(self):
+        """
+        Test that secret configuration values are censored from output.
+        """
+        self.object_ = eva.config.ConfigurableObject()
+        self.object_.env = {'api_key': 'secret', 'string': 'bar'}
+        self.assertListEqual(self.object_.format_config(), ['api_key=****CENSORED****', 'string=bar'])
+
+    def test_missing_required_options(self):
+        """
+        Test that all missing required configuration options are reported at once.
+        """
+        class RequiredConfigObject(MockConfigObject):
+            REQUIRED_CONFIG = ['string', 'int']
+            OPTIONAL_CONFIG = []
+
+        config = \
+"""
+[object]
+"""  # NOQA
+        with self.assertRaises(eva.exceptions.MissingConfigurationException) as e:
+            self.setup_with_config(RequiredConfigObject, config, 'object')
+        self.assertIn('int, string', str(e.exception))
+
+    def test_resolve_dependencies(self):
+        """
+        Test that class dependencies are replaced with their resolved objects.
+        """
+        config = \
+"""
+[object]
+string = bar
+"""  # NOQA
+        config_class = {
+            'class.foo': object(),
+        }
+        self.setup_with_config(MockConfigObject, config, 'object')
+        self.object_.resolve_dependencies(config_class)
+        self.assertIs(self.object_.env['config_class'], config_class['class.foo'])
+        self.assertEqual(self.object_.env['string'], 'bar')
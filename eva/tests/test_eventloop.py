@@ -62,6 +62,61 @@ class TestEventloop(eva.tests.TestBase):
         self.assertEqual(job.resource, event.resource)
         #self.assertIsInstance(job.timer, eva.statsd.StatsDTimer)
 
+    def test_poll_listeners_batch(self):
+        """!
+        @brief Test that all available events are received from a listener,
+        and that the listener position is acknowledged only once.
+        """
+        listener = mock.MagicMock()
+        listener.get_next_event.side_effect = [
+            eva.event.ProductstatusHeartbeatEvent(None, {}),
+            eva.event.ProductstatusHeartbeatEvent(None, {}),
+            eva.event.ProductstatusHeartbeatEvent(None, {}),
+            eva.exceptions.EventTimeoutException('timeout'),
+        ]
+        self.eventloop.listeners = [listener]
+        self.eventloop.poll_listeners()
+        self.assertEqual(listener.get_next_event.call_count, 4)
+        self.assertEqual(listener.acknowledge.call_count, 1)
+
+    def test_poll_listeners_batch_size(self):
+        """!
+        @brief Test that no more than POLL_BATCH_SIZE events are received from
+        a listener in a single poll.
+        """
+        listener = mock.MagicMock()
+        listener.get_next_event.side_effect = lambda: eva.event.ProductstatusHeartbeatEvent(None, {})
+        self.eventloop.listeners = [listener]
+        self.eventloop.poll_listeners()
+        self.assertEqual(listener.get_next_event.call_count, self.eventloop.POLL_BATCH_SIZE)
+        self.assertEqual(listener.acknowledge.call_count, 1)
+
+    def test_poll_listeners_empty(self):
+        """!
+        @brief Test that the listener position is not acknowledged when no
+        events are received.
+        """
+        listener = mock.MagicMock()
+        listener.get_next_event.side_effect = eva.exceptions.EventTimeoutException('timeout')
+        self.eventloop.listeners = [listener]
+        self.eventloop.poll_listeners()
+        self.assertEqual(listener.acknowledge.call_count, 0)
+
+    def test_create_jobs_for_event_queue_item_resource_type(self):
+        """!
+        @brief Test that adapters are not asked to validate resources of a
+        type they cannot process.
+        """
+        adapter = mock.MagicMock()
+        adapter.RESOURCE_TYPES = frozenset(['datainstance'])
+        event = eva.event.ProductstatusLocalEvent(None, {})
+        event.resource = mock.MagicMock()
+        event.resource._collection._resource_name = 'product'
+        item = eva.eventqueue.EventQueueItem(event)
+        item.adapters = [adapter]
+        self.assertListEqual(self.eventloop.create_jobs_for_event_queue_item(item), [])
+        self.assertFalse(adapter.validate_resource.called)
+
     @unittest.skip
     def test_add_event_to_queue(self):
         event = eva.event.Event(None, {})
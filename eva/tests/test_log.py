@@ -1,5 +1,25 @@
+import logging
 import unittest
 
+import eva.logger
+
 
 class TestLogging(unittest.TestCase):
-    pass
+    def make_record(self, created):
+        record = logging.LogRecord('test', logging.INFO, __file__, 1, 'message', (), None)
+        record.created = created
+        record.msecs = (created - int(created)) * 1000
+        return record
+
+    def test_caching_formatter(self):
+        """
+        Test that the caching formatter produces the same timestamps as the
+        standard formatter.
+        """
+        caching = eva.logger.CachingFormatter()
+        standard = logging.Formatter()
+        for created in [1000.0, 1000.5, 1001.25, 1000.75]:
+            record = self.make_record(created)
+            self.assertEqual(caching.formatTime(record), standard.formatTime(record))
+            datefmt = '%Y-%m-%dT%H:%M:%S%Z'
+            self.assertEqual(caching.formatTime(record, datefmt), standard.formatTime(record, datefmt))
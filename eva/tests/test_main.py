@@ -0,0 +1,72 @@
+import logging
+import os
+import tempfile
+import unittest
+
+import eva.__main__
+
+
+class TestMain(unittest.TestCase):
+    def setUp(self):
+        self.main = eva.__main__.Main()
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = os.path.realpath(self.tempdir.name)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def touch(self, *components):
+        path = os.path.join(self.path, *components)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        open(path, 'w').close()
+        return path
+
+    def test_get_config_filenames(self):
+        """!
+        @brief Test that configuration files are discovered recursively, and
+        that only files ending with .ini are returned.
+        """
+        expected = [
+            self.touch('a', 'b', 'c.ini'),
+            self.touch('a', 'd.ini'),
+            self.touch('e.ini'),
+        ]
+        self.touch('a', 'f.txt')
+        single = self.touch('g', 'h.conf')
+        filenames = self.main.get_config_filenames([self.path, single])
+        self.assertListEqual(filenames, expected + [single])
+
+    def test_get_config_filenames_symlinks(self):
+        """!
+        @brief Test that symlinked files are resolved, and that symlinked
+        directories are not followed.
+        """
+        target = self.touch('a', 'b.ini')
+        os.makedirs(os.path.join(self.path, 'c'))
+        os.symlink(target, os.path.join(self.path, 'c', 'd.ini'))
+        os.symlink(os.path.join(self.path, 'a'), os.path.join(self.path, 'c', 'e'))
+        filenames = self.main.get_config_filenames([os.path.join(self.path, 'c')])
+        self.assertListEqual(filenames, [target])
+
+    def test_exit_without_statsd(self):
+        """!
+        @brief Test that EVA can exit before the StatsD client is set up.
+        """
+        with self.assertRaises(SystemExit) as e:
+            self.main.exit(eva.__main__.EXIT_INVALID_CONFIG)
+        self.assertEqual(e.exception.code, eva.__main__.EXIT_INVALID_CONFIG)
+
+    def test_setup_basic_logging_idempotent(self):
+        """!
+        @brief Test that setting up basic logging twice installs only a single
+        handler on the root logger.
+        """
+        handlers = logging.root.handlers[:]
+        level = logging.root.level
+        try:
+            self.main.setup_basic_logging()
+            self.main.setup_basic_logging()
+            self.assertEqual(len(logging.root.handlers), 1)
+        finally:
+            logging.root.handlers = handlers
+            logging.root.setLevel(level)
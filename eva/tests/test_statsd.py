@@ -19,6 +19,7 @@ class TestStatsD(unittest.TestCase):
         self.assertEqual(self.statsd.connections[0]['port'], 8125)
         self.assertEqual(self.statsd.connections[1]['host'], '127.0.0.2')
         self.assertEqual(self.statsd.connections[1]['port'], 8126)
+        self.assertIsNone(self.statsd.connections[0]['socket'])
 
     def test_flatten_tags(self):
         self.assertEqual(self.statsd.flatten_tags({'c': 'x'}), 'c=x')
@@ -52,6 +53,7 @@ class TestStatsD(unittest.TestCase):
         self.assertTrue(func.called)
         self.assertEqual(func.call_count, 2)
         func.assert_called_with(b'foo', ('127.0.0.2', 8126))
+        self.assertIsNotNone(self.statsd.connections[0]['socket'])
 
     @mock.patch('eva.statsd.StatsDClient.broadcast')
     def test_incr(self, func):
@@ -20,6 +20,7 @@ config = {
     'url': 'https://github.com/metno/eva',
     'download_url': 'https://github.com/metno/eva',
     'version': '.'.join([str(x) for x in VERSION]),
+    'python_requires': '>=3.6',
     'install_requires': [
         'nose==1.3.7',
         'python-dateutil==2.5.0',